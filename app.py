@@ -243,7 +243,7 @@ def fetch_and_cache_categories(youtube_service, region_code="US"):
                 "categories": categories,
             }
             with open(CATEGORIES_CACHE_FILE, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+                json.dump(cache_data, f, separators=(',', ':'))  # Machine-only file, keep it compact
             return categories
     except Exception as e:
         print(f"Failed to fetch categories: {e}")
@@ -297,12 +297,21 @@ def save_credentials(credentials, token_file):
         pickle.dump(credentials, token)
 
 
+def build_youtube(credentials):
+    """Build a YouTube API client from the discovery document bundled with googleapiclient.
+
+    static_discovery avoids fetching the document over HTTP; cache_discovery=False skips the
+    legacy oauth2client-based file cache, which only logs a warning on import.
+    """
+    return build('youtube', 'v3', credentials=credentials, static_discovery=True, cache_discovery=False)
+
+
 def get_youtube_service(token_file):
     """Return an authenticated YouTube service, or None if not authenticated."""
     credentials = load_credentials(token_file)
     if not credentials or not credentials.valid:
         return None
-    return build('youtube', 'v3', credentials=credentials)
+    return build_youtube(credentials)
 
 
 def is_authenticated(token_file):
@@ -665,7 +674,7 @@ def oauth2callback():
         # Refresh categories now that we're authenticated.
         try:
             fetch_and_cache_categories(
-                build('youtube', 'v3', credentials=flow.credentials))
+                build_youtube(flow.credentials))
         except Exception:
             pass
     except Exception as e:
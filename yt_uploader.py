@@ -6,41 +6,91 @@ Drag a video file onto this script to upload it to YouTube.
 
 import os
 import sys
+import atexit
 import json
-import pickle
+import math
+import functools
+import hashlib
+import io
+import itertools
+import shutil
+import subprocess
+import time
 import threading
+import queue
+import webbrowser
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
-from datetime import datetime, timedelta
+from operator import itemgetter
+from datetime import datetime, timedelta, timezone
 
 # Drag-and-drop support
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
-# Video thumbnail support
-import cv2
+# Video thumbnail support (cv2 is imported lazily in _extract_thumbnail_images; PIL stays
+# here because the app icon is drawn immediately)
 from PIL import Image, ImageTk, ImageDraw
 
-# Google API imports
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+# Optional faster JSON for the history/categories files; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Google API modules (google.oauth2, googleapiclient, the auth flow) are all imported where
+# they're used, so the window appears before they load
 
 # Constants
 SCRIPT_DIR = Path(__file__).parent.resolve()
 CLIENT_SECRETS_FILE = SCRIPT_DIR / "client_secrets.json"
-TOKEN_FILE = SCRIPT_DIR / "token.pickle"
+TOKEN_FILE = SCRIPT_DIR / "token.json"
+LEGACY_TOKEN_FILE = SCRIPT_DIR / "token.pickle"  # Pre-JSON token format, migrated on first run
 CATEGORIES_CACHE_FILE = SCRIPT_DIR / "categories_cache.json"
-HISTORY_FILE = SCRIPT_DIR / "upload_history.json"
+HISTORY_FILE = SCRIPT_DIR / "upload_history.jsonl"
+LEGACY_HISTORY_FILE = SCRIPT_DIR / "upload_history.json"  # Pre-JSONL history format, migrated on first run
+THUMBNAIL_CACHE_DIR = SCRIPT_DIR / "thumbnail_cache"
+UPLOADS_PLAYLIST_CACHE_FILE = SCRIPT_DIR / "uploads_playlist.json"
 SCOPES = [
     "https://www.googleapis.com/auth/youtube",  # Full access (needed for delete)
     "https://www.googleapis.com/auth/youtube.upload",
     "https://www.googleapis.com/auth/youtube.readonly",  # For reading scheduled videos
 ]
 
+# Refresh the OAuth access token in the background once it is this close to expiring
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+TOKEN_REFRESH_CHECK_MS = 60_000
+
+# Guards refreshing and persisting credentials (background refresher vs. get_authenticated_service)
+_credentials_lock = threading.Lock()
+_active_credentials = None  # Credentials backing the most recently built service
+
+# Uploads are sent in chunks of this size: large enough to keep per-request overhead low, small
+# enough that progress, speed/ETA and Cancel still update every few seconds on a slow link
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# How often the Tk thread checks whether a worker-pool task it's waiting on has finished
+FUTURE_POLL_MS = 50
+
+# Socket timeout (seconds) for API requests; generous so a slow chunk PUT doesn't time out,
+# but a stalled connection eventually errors out instead of hanging the upload forever
+API_HTTP_TIMEOUT = 600
+
 # Supported video formats
-VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.mpeg', '.mpg', '.3gp'}
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.mpeg', '.mpg', '.3gp'})
+_VIDEO_EXTENSIONS_FILEDIALOG = " ".join(f"*{ext}" for ext in sorted(VIDEO_EXTENSIONS))
+_VIDEO_EXTENSIONS_DISPLAY = ", ".join(sorted(VIDEO_EXTENSIONS))
+
+# Schedule picker values (zero-padded) that never change
+_MONTHS = tuple(f"{i:02d}" for i in range(1, 13))
+_DAYS = tuple(f"{i:02d}" for i in range(1, 32))
+_HOURS = tuple(f"{i:02d}" for i in range(1, 13))
+_MINUTES = tuple(f"{i:02d}" for i in range(0, 60, 5))
+_AMPM = ("AM", "PM")
+
+# How scheduled publish times are shown in the schedule dialog
+SCHEDULE_DISPLAY_FORMAT = "%a %b %d, %Y @ %I:%M %p"
 
 # Fallback YouTube categories (used if API fetch fails)
 DEFAULT_YOUTUBE_CATEGORIES = {
@@ -61,107 +111,348 @@ DEFAULT_YOUTUBE_CATEGORIES = {
     "Nonprofits & Activism": "29",
 }
 
+# The cached list is served for up to CATEGORIES_MAX_AGE; past CATEGORIES_REVALIDATE_AGE it is
+# revalidated against the stored ETag, which costs a body-less 304 when nothing changed.
+CATEGORIES_MAX_AGE = timedelta(days=7)
+CATEGORIES_REVALIDATE_AGE = timedelta(hours=1)
+
+
+# Parsed categories cache, keyed by the file's mtime so it's only re-read when the file changes
+# (including when app.py rewrites it)
+_CATEGORIES_CACHE = {"mtime": None, "data": None}
+
+
+def _read_categories_cache():
+    """Return (categories, fetched_at, etag) from the categories cache file, or None."""
+    try:
+        mtime = CATEGORIES_CACHE_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+    if _CATEGORIES_CACHE["mtime"] == mtime:
+        return _CATEGORIES_CACHE["data"]
+    try:
+        with open(CATEGORIES_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache_data = _json_loads(f.read())
+        data = (cache_data["categories"], datetime.fromisoformat(cache_data["fetched_at"]),
+                cache_data.get("etag"))
+    except Exception:
+        data = None
+    _CATEGORIES_CACHE.update(mtime=mtime, data=data)
+    return data
+
 
 def get_youtube_categories():
-    """Get YouTube categories from cache or return defaults."""
-    if CATEGORIES_CACHE_FILE.exists():
+    """Get YouTube categories from cache or return defaults.
+
+    Returns (categories, is_fresh); is_fresh is False when the cache should be revalidated.
+    """
+    cached = _read_categories_cache()
+    if cached:
+        categories, fetched_at, _etag = cached
+        age = datetime.now() - fetched_at
+        if age < CATEGORIES_MAX_AGE:
+            return dict(categories), age < CATEGORIES_REVALIDATE_AGE
+    return DEFAULT_YOUTUBE_CATEGORIES.copy(), False
+
+
+# Upload history is an append-only JSON-Lines file: each line is either a new entry or a
+# partial update for an existing one (matched by 'uploaded_at', later lines win). It's
+# compacted back down to one line per entry once it grows past HISTORY_COMPACT_LINES.
+HISTORY_MAX_ENTRIES = 100
+HISTORY_COMPACT_LINES = 200
+
+# Merged history ({uploaded_at: entry}, oldest first), keyed by the history file's mtime
+# so it's only re-read when the file changes
+_HISTORY_CACHE = {"mtime": None, "entries": None, "lines": 0}
+
+# update_history_entry() only queues its update; a writer thread merges whatever arrives
+# within HISTORY_WRITE_DELAY seconds per entry and appends it in one write. _history_lock
+# guards the history file and _HISTORY_CACHE between that thread and the Tk thread.
+HISTORY_WRITE_DELAY = 0.5
+_history_lock = threading.RLock()
+_history_queue = queue.Queue()
+_history_writer_thread = None
+
+
+def _json_loads(data):
+    """Parse JSON text with orjson when it's installed, else the stdlib json module."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize obj as compact JSON text with orjson when it's installed, else the stdlib json module."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)  # ASCII-escaped for the C encoder
+
+
+def _dump_history_line(record):
+    """Serialize one history record as a compact JSON line."""
+    return _json_dumps(record) + "\n"
+
+
+def _migrate_legacy_history():
+    """Convert a legacy upload_history.json (one JSON list) into upload_history.jsonl (one-shot)."""
+    if not LEGACY_HISTORY_FILE.exists() or HISTORY_FILE.exists():
+        return
+    try:
+        with open(LEGACY_HISTORY_FILE, 'r', encoding='utf-8') as f:
+            history = _json_loads(f.read())
+        save_upload_history(history)
+        LEGACY_HISTORY_FILE.unlink()
+    except Exception as e:
+        print(f"Failed to migrate legacy history: {e}")
+
+
+def _load_history_entries():
+    """Return the cached {uploaded_at: entry} mapping, re-reading the file only if it changed."""
+    _migrate_legacy_history()
+    try:
+        mtime = HISTORY_FILE.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _HISTORY_CACHE["mtime"] == mtime and _HISTORY_CACHE["entries"] is not None:
+        return _HISTORY_CACHE["entries"]
+    entries = {}
+    lines = 0
+    try:
+        with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = _json_loads(line)
+                except ValueError:
+                    continue  # Skip a torn/partial line rather than losing the whole history
+                lines += 1
+                key = record.get('uploaded_at')
+                if key in entries:
+                    entries[key].update(record)
+                else:
+                    entries[key] = record
+    except Exception:
+        return {}
+    _HISTORY_CACHE.update(mtime=mtime, entries=entries, lines=lines)
+    return entries
+
+
+def _append_history_records(records, updates_only=False):
+    """Append JSON lines to the history file in one write and keep the cache in sync.
+
+    With updates_only, records for entries that are no longer in the history (e.g. dropped
+    by compaction since they were queued) are skipped rather than re-added as partial entries.
+    """
+    with _history_lock:
+        entries = _load_history_entries()
+        if updates_only:
+            records = [record for record in records if record.get('uploaded_at') in entries]
+            if not records:
+                return
+        with open(HISTORY_FILE, 'a', encoding='utf-8') as f:
+            f.write("".join(_dump_history_line(record) for record in records))
+        for record in records:
+            key = record.get('uploaded_at')
+            if key in entries:
+                entries[key].update(record)
+            else:
+                entries[key] = dict(record)
+        _HISTORY_CACHE.update(mtime=HISTORY_FILE.stat().st_mtime_ns, entries=entries,
+                              lines=_HISTORY_CACHE["lines"] + len(records))
+        if _HISTORY_CACHE["lines"] > HISTORY_COMPACT_LINES:
+            save_upload_history(load_upload_history())
+
+
+def _history_writer():
+    """Writer thread: batch queued (uploaded_at, updates) pairs into merged appends until None."""
+    stopping = False
+    while not stopping:
+        item = _history_queue.get()
+        if item is None:
+            return
+        time.sleep(HISTORY_WRITE_DELAY)  # Let a few more updates arrive to merge with this one
+
+        pending = {}  # uploaded_at -> merged updates, in arrival order
+        while item is not None:
+            uploaded_at, updates = item
+            pending.setdefault(uploaded_at, {'uploaded_at': uploaded_at}).update(updates)
+            try:
+                item = _history_queue.get_nowait()
+            except queue.Empty:
+                break
+        else:
+            stopping = True  # Got the shutdown sentinel; write this last batch first
+
         try:
-            with open(CATEGORIES_CACHE_FILE, 'r') as f:
-                cache_data = json.load(f)
-            # Check if cache is less than 7 days old
-            fetched_at = datetime.fromisoformat(cache_data["fetched_at"])
-            if datetime.now() - fetched_at < timedelta(days=7):
-                return cache_data["categories"]
-        except Exception:
-            pass
-    return DEFAULT_YOUTUBE_CATEGORIES.copy()
+            _append_history_records(list(pending.values()), updates_only=True)
+        except Exception as e:
+            print(f"Failed to save history: {e}")
+
+
+def flush_history():
+    """Write any queued history updates and stop the writer thread (it restarts on demand)."""
+    global _history_writer_thread
+    thread = _history_writer_thread
+    if thread is None:
+        return
+    _history_queue.put(None)
+    thread.join()
+    _history_writer_thread = None
+
+
+atexit.register(flush_history)
 
 
 def load_upload_history():
-    """Load upload history from file."""
-    if HISTORY_FILE.exists():
-        try:
-            with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return []
+    """Load upload history (most recent first, at most HISTORY_MAX_ENTRIES).
+
+    Returns copies of the cached entries, which the history writer thread updates in place.
+    """
+    with _history_lock:
+        entries = _load_history_entries()
+        return [dict(entry) for entry in itertools.islice(reversed(entries.values()), HISTORY_MAX_ENTRIES)]
 
 
 def save_upload_history(history):
-    """Save upload history to file."""
-    try:
-        with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print(f"Failed to save history: {e}")
+    """Rewrite the history file with one line per entry (history is most recent first)."""
+    with _history_lock:
+        try:
+            history = history[:HISTORY_MAX_ENTRIES]
+            with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
+                for entry in reversed(history):
+                    f.write(_dump_history_line(entry))
+            # Keep the cache in sync with what we just wrote instead of re-reading it
+            entries = {entry.get('uploaded_at'): dict(entry) for entry in reversed(history)}
+            _HISTORY_CACHE.update(mtime=HISTORY_FILE.stat().st_mtime_ns, entries=entries,
+                                  lines=len(entries))
+        except Exception as e:
+            print(f"Failed to save history: {e}")
 
 
 def add_to_history(entry):
     """Add an entry to upload history. Returns the entry's uploaded_at timestamp for later updates."""
-    history = load_upload_history()
     # Add timestamp if not present
     if 'uploaded_at' not in entry:
         entry['uploaded_at'] = datetime.now().isoformat()
-    # Add to beginning of list (most recent first)
-    history.insert(0, entry)
-    # Keep only last 100 entries
-    history = history[:100]
-    save_upload_history(history)
+    try:
+        _append_history_records([entry])
+    except Exception as e:
+        print(f"Failed to save history: {e}")
     return entry['uploaded_at']
 
 
 def update_history_entry(uploaded_at, updates):
-    """Update an existing history entry by its uploaded_at timestamp."""
-    history = load_upload_history()
-    for entry in history:
-        if entry.get('uploaded_at') == uploaded_at:
-            entry.update(updates)
-            save_upload_history(history)
-            return True
-    return False
+    """Queue an update for an existing history entry, by its uploaded_at timestamp.
+
+    The write happens shortly after on the history writer thread (see flush_history).
+    """
+    global _history_writer_thread
+    with _history_lock:
+        if uploaded_at not in _load_history_entries():
+            return False
+    if _history_writer_thread is None:
+        _history_writer_thread = threading.Thread(target=_history_writer, name='ytu-history', daemon=True)
+        _history_writer_thread.start()
+    _history_queue.put((uploaded_at, dict(updates)))
+    return True
+
+
+def throttle(interval):
+    """Decorator for update_history_entry-style functions: skip calls within interval seconds
+    of the last one that ran. Calls whose updates carry a 'status' always run, so terminal
+    states are never dropped; the first call always runs too.
+    """
+    def decorator(func):
+        last_call = {'time': None}
+
+        @functools.wraps(func)
+        def wrapper(uploaded_at, updates):
+            now = time.monotonic()
+            if ('status' not in updates and last_call['time'] is not None
+                    and now - last_call['time'] < interval):
+                return False
+            last_call['time'] = now
+            return func(uploaded_at, updates)
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=8)
+def _draw_icon_rgba(size):
+    """Draw the YouTube-style app icon as a PIL RGBA image (cached per size)."""
+    # Create a red rounded rectangle with white play triangle
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    # Red background (rounded rectangle approximation)
+    margin = size // 8
+    draw.rounded_rectangle(
+        [margin, margin, size - margin, size - margin],
+        radius=size // 6,
+        fill='#FF0000'
+    )
+
+    # White play triangle
+    center_x = size // 2
+    center_y = size // 2
+    tri_size = size // 4
+
+    # Triangle points (pointing right)
+    points = [
+        (center_x - tri_size // 2 + 1, center_y - tri_size),
+        (center_x - tri_size // 2 + 1, center_y + tri_size),
+        (center_x + tri_size, center_y)
+    ]
+    draw.polygon(points, fill='white')
+
+    return img
 
 
 def create_app_icon(size=32):
     """Create a YouTube-style app icon programmatically."""
     try:
-        # Create a red rounded rectangle with white play triangle
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        # Red background (rounded rectangle approximation)
-        margin = size // 8
-        draw.rounded_rectangle(
-            [margin, margin, size - margin, size - margin],
-            radius=size // 6,
-            fill='#FF0000'
-        )
-
-        # White play triangle
-        center_x = size // 2
-        center_y = size // 2
-        tri_size = size // 4
-
-        # Triangle points (pointing right)
-        points = [
-            (center_x - tri_size // 2 + 1, center_y - tri_size),
-            (center_x - tri_size // 2 + 1, center_y + tri_size),
-            (center_x + tri_size, center_y)
-        ]
-        draw.polygon(points, fill='white')
-
-        return ImageTk.PhotoImage(img)
+        # PhotoImage needs a live Tk root, so only the PIL drawing is cached
+        return ImageTk.PhotoImage(_draw_icon_rgba(size))
     except Exception:
         return None
 
 
+def _write_categories_cache(categories, region_code, etag):
+    cache_data = {
+        "fetched_at": datetime.now().isoformat(),
+        "region_code": region_code,
+        "etag": etag,
+        "categories": categories
+    }
+    with open(CATEGORIES_CACHE_FILE, 'w', encoding='utf-8') as f:
+        f.write(_json_dumps(cache_data))  # Machine-only file, keep it compact
+
+
 def fetch_and_cache_categories(youtube_service, region_code="US"):
-    """Fetch YouTube categories from API and cache them."""
+    """Fetch YouTube categories from API and cache them.
+
+    If the cache holds an ETag the request is made conditional; a 304 just marks the cached
+    categories as fresh again and returns them.
+    """
+    from googleapiclient.errors import HttpError
+
+    cached = _read_categories_cache()
     try:
-        response = youtube_service.videoCategories().list(
+        request = youtube_service.videoCategories().list(
             part="snippet",
             regionCode=region_code
-        ).execute()
+        )
+        if cached and cached[2]:
+            request.headers['If-None-Match'] = cached[2]
+        try:
+            response = request.execute()
+        except HttpError as e:
+            if e.resp.status != 304:
+                raise
+            _write_categories_cache(cached[0], region_code, cached[2])
+            return cached[0]
 
         categories = {}
         for item in response.get("items", []):
@@ -170,32 +461,118 @@ def fetch_and_cache_categories(youtube_service, region_code="US"):
                 categories[item["snippet"]["title"]] = item["id"]
 
         if categories:
-            cache_data = {
-                "fetched_at": datetime.now().isoformat(),
-                "region_code": region_code,
-                "categories": categories
-            }
-            with open(CATEGORIES_CACHE_FILE, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            _write_categories_cache(categories, region_code, response.get("etag"))
             return categories
     except Exception as e:
         print(f"Failed to fetch categories: {e}")
     return None
 
 
-def get_authenticated_service():
-    """Authenticate and return YouTube service."""
+def migrate_legacy_token():
+    """Convert a legacy token.pickle into token.json (one-shot)."""
+    if not LEGACY_TOKEN_FILE.exists() or TOKEN_FILE.exists():
+        return
+    try:
+        # Only needed for the one-time migration, so import it here
+        import pickle
+        with open(LEGACY_TOKEN_FILE, 'rb') as token:
+            credentials = pickle.load(token)
+        save_credentials(credentials)
+        LEGACY_TOKEN_FILE.unlink()
+    except Exception as e:
+        print(f"Failed to migrate legacy token: {e}")
+
+
+def load_credentials():
+    """Load saved credentials from TOKEN_FILE. Returns Credentials or None."""
+    from google.oauth2.credentials import Credentials
+
+    try:
+        with open(TOKEN_FILE, 'r', encoding='utf-8') as token:
+            # No scopes argument: passing SCOPES would replace the scopes stored in the file,
+            # hiding a token that was granted fewer scopes than we now need
+            return Credentials.from_authorized_user_info(json.load(token))
+    except Exception as e:
+        print(f"Failed to load saved credentials: {e}")
+        return None
+
+
+def save_credentials(credentials):
+    """Save credentials to TOKEN_FILE as JSON.
+
+    Written to a temp file and swapped in with os.replace, so an interrupted write can't
+    leave a truncated token behind (which would force a full re-auth on the next launch).
+    """
+    tmp_file = TOKEN_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as token:
+        token.write(credentials.to_json())
+    os.replace(tmp_file, TOKEN_FILE)
+
+
+def refresh_credentials_if_expiring():
+    """Refresh the active (or saved) credentials if they expire within TOKEN_REFRESH_MARGIN.
+
+    Meant to run on a background thread so the refresh round-trip doesn't land on
+    the user-facing upload path. Returns True if a refresh happened.
+    """
+    from google.auth.transport.requests import Request
+
+    global _active_credentials
+    with _credentials_lock:
+        credentials = _active_credentials
+        if credentials is None:
+            if not TOKEN_FILE.exists():
+                return False
+            credentials = load_credentials()
+        if not credentials or not credentials.refresh_token or not credentials.expiry:
+            return False
+        # google-auth keeps expiry as a naive UTC datetime
+        now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+        if credentials.expiry - now_utc >= TOKEN_REFRESH_MARGIN:
+            return False
+        try:
+            credentials.refresh(Request())
+            save_credentials(credentials)
+        except Exception as e:
+            # Leave it to get_authenticated_service to recover (re-auth) inline
+            print(f"Background token refresh failed: {e}")
+            return False
+        if _active_credentials is None:
+            _active_credentials = credentials
+        return True
+
+
+def get_authenticated_service(interactive=True):
+    """Authenticate and return YouTube service.
+
+    With interactive=False, returns None instead of showing a dialog or running the
+    browser sign-in, so it's safe to call from a worker thread.
+    """
+    with _credentials_lock:
+        return _get_authenticated_service_locked(interactive)
+
+
+def _get_authenticated_service_locked(interactive=True):
+    """Body of get_authenticated_service; caller must hold _credentials_lock."""
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.exceptions import RefreshError
+    from google.auth.transport.requests import Request
+
+    global _active_credentials
     credentials = None
 
+    migrate_legacy_token()
+
     # Check if we have saved credentials
     if TOKEN_FILE.exists():
-        with open(TOKEN_FILE, 'rb') as token:
-            credentials = pickle.load(token)
+        credentials = load_credentials()
 
-        # Check if credentials have all required scopes
-        if credentials and hasattr(credentials, 'scopes'):
+        # Check if credentials have all required scopes (.scopes is what the file stored)
+        if credentials and credentials.scopes:
             if not all(scope in credentials.scopes for scope in SCOPES):
                 # Scopes changed, need to re-authenticate
+                if not interactive:
+                    return None
                 credentials = None
                 TOKEN_FILE.unlink()  # Delete old token
 
@@ -204,15 +581,27 @@ def get_authenticated_service():
         if credentials and credentials.expired and credentials.refresh_token:
             try:
                 credentials.refresh(Request())
-            except Exception as e:
-                # Token refresh failed (expired/revoked), need to re-authenticate
+            except RefreshError as e:
+                # Token expired/revoked, need to re-authenticate. A background (non-interactive)
+                # caller leaves that, and the token, to the next interactive sign-in.
                 print(f"Token refresh failed: {e}")
+                if not interactive:
+                    return None
                 credentials = None
                 if TOKEN_FILE.exists():
                     TOKEN_FILE.unlink()  # Delete invalid token
+            except Exception as e:
+                # Couldn't reach Google (e.g. offline); the token may still be good, so keep it
+                print(f"Token refresh failed: {e}")
+                if interactive:
+                    messagebox.showerror("Connection Error",
+                                         f"Couldn't refresh your YouTube sign-in:\n\n{e}")
+                return None
         
         # If credentials are still invalid, run the auth flow
         if not credentials or not credentials.valid:
+            if not interactive:
+                return None
             if not CLIENT_SECRETS_FILE.exists():
                 messagebox.showerror(
                     "Missing Credentials",
@@ -239,10 +628,351 @@ def get_authenticated_service():
             credentials = flow.run_local_server(port=0)
 
         # Save credentials for next run
-        with open(TOKEN_FILE, 'wb') as token:
-            pickle.dump(credentials, token)
+        save_credentials(credentials)
+
+    _active_credentials = credentials
+    return build_youtube_service(credentials)
+
+
+def build_youtube_service(credentials):
+    """Build a YouTube API client for credentials, with its own HTTP connection.
+
+    httplib2 connections aren't thread-safe, so each thread making API calls needs its own.
+    """
+    from googleapiclient.discovery import build
+    import google_auth_httplib2
+    import httplib2
+
+    # Keep-alive httplib2 connection with a timeout (the default has none)
+    http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http(timeout=API_HTTP_TIMEOUT))
+    # Use the discovery document bundled with googleapiclient (no HTTP fetch) and skip the
+    # legacy oauth2client-based discovery file cache, which only logs a warning on import
+    return build('youtube', 'v3', http=http, static_discovery=True, cache_discovery=False)
+
+
+def _refresh_categories_in_background(auth_future):
+    """Revalidate the categories cache once the startup sign-in is done; runs on a worker thread.
+
+    Waits for auth_future (the background get_authenticated_service) here rather than on the
+    Tk thread, then uses a client of its own. Returns the categories, or None if there's no
+    usable saved sign-in or the fetch failed.
+    """
+    if not auth_future.result():
+        return None
+    return fetch_and_cache_categories(build_youtube_service(_active_credentials))
+
+
+# A channel's uploads playlist id never changes, so the cached one is only re-checked occasionally
+UPLOADS_PLAYLIST_CACHE_TTL = timedelta(days=30)
+
+
+def _account_fingerprint():
+    """Short hash of the active refresh token, or None. Changes when the user signs in again."""
+    credentials = _active_credentials
+    if not credentials or not credentials.refresh_token:
+        return None
+    return hashlib.blake2b(credentials.refresh_token.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def load_cached_uploads_playlist_id():
+    """Return the cached uploads playlist id for the signed-in account, or None if it's missing/stale."""
+    fingerprint = _account_fingerprint()
+    if not fingerprint or not UPLOADS_PLAYLIST_CACHE_FILE.exists():
+        return None
+    try:
+        with open(UPLOADS_PLAYLIST_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache_data = _json_loads(f.read())
+        if cache_data.get("account") != fingerprint:
+            return None  # Cached for a different sign-in
+        if datetime.now() - datetime.fromisoformat(cache_data["cached_at"]) >= UPLOADS_PLAYLIST_CACHE_TTL:
+            return None
+        return cache_data["uploads_playlist_id"]
+    except Exception:
+        return None
+
+
+def save_uploads_playlist_id(channel_id, uploads_playlist_id):
+    """Cache the signed-in account's uploads playlist id."""
+    fingerprint = _account_fingerprint()
+    if not fingerprint:
+        return
+    cache_data = {
+        "cached_at": datetime.now().isoformat(),
+        "account": fingerprint,
+        "channel_id": channel_id,
+        "uploads_playlist_id": uploads_playlist_id
+    }
+    try:
+        with open(UPLOADS_PLAYLIST_CACHE_FILE, 'w', encoding='utf-8') as f:
+            f.write(_json_dumps(cache_data))
+    except OSError as e:
+        print(f"Failed to cache uploads playlist: {e}")
+
+
+# Longest side of the full-size thumbnail shown in the popup
+THUMBNAIL_FULL_MAX_DIM = 800
+
+# Generated thumbnails are cached on disk; the oldest are pruned past this many videos
+THUMBNAIL_CACHE_MAX_ENTRIES = 200
+# Part of the cache key; bump it when the frame-picking rule changes so old thumbnails aren't reused
+THUMBNAIL_CACHE_VERSION = 2
+
+
+def _thumb_cache_key(video_path):
+    """Cache key for a video's thumbnails: changes whenever the file is modified or replaced."""
+    st = os.stat(video_path)
+    key = f"{THUMBNAIL_CACHE_VERSION}|{os.path.abspath(video_path)}|{st.st_mtime_ns}|{st.st_size}"
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _load_cached_thumbnails(key):
+    """Return the cached (full_image, small_image) for key, or None if they aren't cached."""
+    full_path = THUMBNAIL_CACHE_DIR / f"{key}_full.png"
+    small_path = THUMBNAIL_CACHE_DIR / f"{key}_small.png"
+    try:
+        with Image.open(full_path) as full, Image.open(small_path) as small:
+            full.load()
+            small.load()
+            return full.copy(), small.copy()
+    except OSError:
+        return None
+
+
+def _save_cached_thumbnails(key, full_image, small_image):
+    """Write a video's thumbnails to the disk cache, pruning the oldest entries if it's full."""
+    try:
+        THUMBNAIL_CACHE_DIR.mkdir(exist_ok=True)
+        full_image.save(THUMBNAIL_CACHE_DIR / f"{key}_full.png")
+        small_image.save(THUMBNAIL_CACHE_DIR / f"{key}_small.png")
+
+        cached = sorted(THUMBNAIL_CACHE_DIR.glob("*_full.png"), key=lambda p: p.stat().st_mtime)
+        for full_path in cached[:-THUMBNAIL_CACHE_MAX_ENTRIES]:
+            full_path.unlink(missing_ok=True)
+            full_path.with_name(full_path.name.replace("_full.png", "_small.png")).unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Failed to cache thumbnail: {e}")
+
+
+def _fit_within(width, height, max_dim):
+    """Return (width, height) scaled down so neither side exceeds max_dim (unchanged if it fits)."""
+    if width <= max_dim and height <= max_dim:
+        return width, height
+    ratio = max_dim / max(width, height)
+    return int(width * ratio), int(height * ratio)
+
+
+def _read_thumbnail_frame_av(video_path):
+    """Decode the thumbnail frame with PyAV and return it as an RGB PIL image, or None.
+
+    Seeks to the keyframe at/before the target time, then decodes forward to the first frame
+    at/after it, so only that keyframe's group of pictures is decoded. Raises ImportError if
+    PyAV isn't installed.
+    """
+    import av
+
+    with av.open(video_path) as container:
+        if not container.streams.video:
+            return None
+        stream = container.streams.video[0]
+
+        # 10% into the video (or 1 second, whichever is less)
+        if stream.duration and stream.time_base:
+            duration = float(stream.duration * stream.time_base)
+        elif container.duration:
+            duration = container.duration / av.time_base
+        else:
+            duration = 0
+        target_seconds = min(duration / 10, 1.0) if duration > 0 else 1.0
+
+        if stream.time_base:
+            container.seek(int(target_seconds / stream.time_base), stream=stream)
+        last_frame = None
+        for frame in container.decode(stream):
+            last_frame = frame
+            if frame.time is None or frame.time >= target_seconds:
+                break
+        # Decoded straight to RGB, no BGR hop. A clip ending before the target gets its last frame.
+        return last_frame.to_image() if last_frame is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_tool(name):
+    """Path to an FFmpeg executable ('ffmpeg' or 'ffprobe') on PATH, or None."""
+    return shutil.which(name)
+
+
+# Keeps ffmpeg/ffprobe from flashing a console window on Windows
+_SUBPROCESS_FLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
+def _ffprobe_duration(video_path):
+    """Container duration in seconds from ffprobe (reads only the headers), or 0 if unknown."""
+    ffprobe = _ffmpeg_tool('ffprobe')
+    if not ffprobe:
+        return 0
+    proc = subprocess.run(
+        [ffprobe, '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0',
+         str(video_path)],
+        capture_output=True, text=True, timeout=30, creationflags=_SUBPROCESS_FLAGS,
+    )
+    try:
+        return float(proc.stdout.strip())
+    except ValueError:
+        return 0  # 'N/A' or no output
+
+
+def _read_thumbnail_frame_ffmpeg(video_path):
+    """Grab the thumbnail frame with the ffmpeg CLI and return it as an RGB PIL image, or None.
+
+    ffmpeg seeks, decodes one frame and scales it to popup size itself, so only a small PNG
+    comes back over the pipe. The frame is picked with the same rule as the PyAV reader
+    (10% in or 1 second, whichever is less), using ffprobe for the duration. Returns None if
+    ffmpeg isn't on PATH or produced no frame.
+    """
+    ffmpeg = _ffmpeg_tool('ffmpeg')
+    if not ffmpeg:
+        return None
+    duration = _ffprobe_duration(video_path)
+    target_seconds = min(duration / 10, 1.0) if duration > 0 else 1.0
+    max_dim = THUMBNAIL_FULL_MAX_DIM
+    proc = subprocess.run(
+        [ffmpeg, '-nostdin', '-loglevel', 'error', '-ss', f"{target_seconds:.3f}",
+         '-i', str(video_path), '-frames:v', '1',
+         '-vf', f"scale='min({max_dim},iw)':'min({max_dim},ih)':force_original_aspect_ratio=decrease",
+         '-f', 'image2pipe', '-vcodec', 'png', '-'],
+        capture_output=True, timeout=30, creationflags=_SUBPROCESS_FLAGS,
+    )
+    if proc.returncode != 0 or not proc.stdout:
+        return None
+    image = Image.open(io.BytesIO(proc.stdout))
+    return image.convert('RGB')
+
+
+def _read_thumbnail_frame_cv2(video_path):
+    """Decode the thumbnail frame with OpenCV and return it as an RGB PIL image, or None."""
+    import cv2
+    import numpy as np  # Installed with opencv-python
+
+    # Open the video file with the FFmpeg backend directly instead of probing each backend in
+    # turn, falling back to auto-detection for OpenCV builds without FFmpeg
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
+    if not cap.isOpened():
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            return None
 
-    return build('youtube', 'v3', credentials=credentials)
+    # Get video properties
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS)
+
+    # Skip ahead 10% into the video (or 1 second, whichever is less, capped at 30 frames)
+    # This usually gets a more interesting frame than the first frame. Frames are skipped with
+    # grab(), which demuxes/decodes without converting the frame for Python; seeking with
+    # CAP_PROP_POS_FRAMES re-decodes from the previous keyframe and can land on the wrong frame.
+    one_second = min(int(fps), 30) if fps > 0 else 30
+    target_frame = min(total_frames // 10, one_second) if total_frames > 0 else one_second
+    grabbed = False
+    for _ in range(target_frame + 1):
+        if not cap.grab():
+            break  # Short video: fall back to the last frame we reached
+        grabbed = True
+
+    # Decode only the frame we stopped on, then release the file right away
+    ret, frame = cap.retrieve() if grabbed else (False, None)
+    cap.release()
+
+    if not ret or frame is None:
+        return None
+
+    # Shrink the raw frame to popup size with OpenCV's area averaging before it's flipped and
+    # copied into PIL, so neither step has to touch the full-resolution frame
+    height, width = frame.shape[:2]
+    new_size = _fit_within(width, height, THUMBNAIL_FULL_MAX_DIM)
+    if new_size != (width, height):
+        frame = cv2.resize(frame, new_size, interpolation=cv2.INTER_AREA)
+
+    # Convert BGR to RGB by reversing the channel axis (a view), made contiguous for PIL in one pass
+    return Image.fromarray(np.ascontiguousarray(frame[:, :, ::-1]))
+
+
+def _extract_thumbnail_images(video_path):
+    """Decode a frame from the video and return (full_image, small_image) PIL images, or None.
+
+    Results are cached on disk per (path, mtime, size). Uses PyAV when it's installed, then
+    the ffmpeg CLI if it's on PATH, falling back to OpenCV. Runs on a worker thread, so it
+    must not touch any Tk objects.
+    """
+    try:
+        cache_key = _thumb_cache_key(video_path)
+    except OSError:
+        cache_key = None
+    if cache_key:
+        cached = _load_cached_thumbnails(cache_key)
+        if cached:
+            return cached
+
+    pil_image = None
+    try:
+        pil_image = _read_thumbnail_frame_av(video_path)
+    except ImportError:
+        pass  # PyAV is optional
+    except Exception as e:
+        print(f"PyAV couldn't read a thumbnail frame, falling back: {e}")
+
+    if pil_image is None:
+        try:
+            pil_image = _read_thumbnail_frame_ffmpeg(video_path)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"ffmpeg couldn't read a thumbnail frame, falling back to OpenCV: {e}")
+
+    if pil_image is None:
+        pil_image = _read_thumbnail_frame_cv2(video_path)
+    if pil_image is None:
+        return None
+
+    # Full-size image for popup (scaled to reasonable max size; the ffmpeg and OpenCV readers
+    # already did this)
+    full_size = _fit_within(*pil_image.size, THUMBNAIL_FULL_MAX_DIM)
+    if full_size != pil_image.size:
+        full_image = _downscale(pil_image, full_size)
+    else:
+        full_image = pil_image
+
+    # Resize to fit next to browse button (small thumbnail). The popup image is already a
+    # downscaled copy of the frame, so start from it rather than the full-resolution frame.
+    max_height = 40
+    width, height = full_image.size
+    ratio = max_height / height
+    new_width = max(1, int(width * ratio))
+    # BILINEAR is plenty at 40px, where LANCZOS's extra sharpness isn't visible
+    small_image = _downscale(full_image, (new_width, max_height), Image.Resampling.BILINEAR)
+
+    if cache_key:
+        _save_cached_thumbnails(cache_key, full_image, small_image)
+    return full_image, small_image
+
+
+def _downscale(image, size, resample=Image.Resampling.LANCZOS):
+    """Resize a PIL image down to size, box-reducing first when the source is much larger.
+
+    reducing_gap=2.0 has Pillow do an integer reduce() (box filter) down to ~2x the
+    target before the resample pass, so the filter kernel only touches a fraction of
+    the original pixels. Sources already within 2x of the target skip the reduce step.
+    """
+    return image.resize(size, resample, reducing_gap=2.0)
+
+
+class UploadState:
+    """Progress and outcome of one upload, as tracked on the Tk thread."""
+
+    __slots__ = ('progress', 'done', 'error', 'response', 'video_id')
+
+    def __init__(self):
+        self.progress = 0  # Percent, 0-100
+        self.done = False  # Finished, failed or cancelled
+        self.error = None  # Exception raised by the upload, if any
+        self.response = None  # videos().insert response on success
+        self.video_id = None
 
 
 class UploadProgressWindow:
@@ -260,7 +990,10 @@ class UploadProgressWindow:
         self.parent = parent
         self._current_progress = 0
         self.file_size = file_size  # Total file size in bytes
-        self.start_time = None  # Track upload start time
+        self.start_time = time.time()  # The upload starts right after this window is shown
+        self._total_size_text = self._format_size(file_size)  # Never changes, so format once
+        self._pending_progress = None  # Latest progress not yet drawn (see _drain)
+        self._drain_after_id = None  # Pending after_idle render, if any
 
         # Center on parent
         self.window.update_idletasks()
@@ -286,7 +1019,7 @@ class UploadProgressWindow:
         self.percent_label.pack(side=tk.RIGHT, anchor=tk.E)
 
         # Transfer info label (shows transferred/total and speed)
-        self.transfer_label = ttk.Label(frame, text=f"0 MB / {self._format_size(self.file_size)}")
+        self.transfer_label = ttk.Label(frame, text=f"0 MB / {self._total_size_text}")
         self.transfer_label.pack(anchor=tk.W, pady=(5, 0))
 
         # Speed/ETA label
@@ -303,9 +1036,8 @@ class UploadProgressWindow:
         # Handle window close button
         self.window.protocol("WM_DELETE_WINDOW", self._on_cancel)
 
-        # Force initial render
+        # Force initial render (geometry/redraw only; don't re-enter other event handlers)
         self.window.update_idletasks()
-        self.window.update()
 
     def _on_cancel(self):
         """Handle cancel button click."""
@@ -318,7 +1050,6 @@ class UploadProgressWindow:
             self.cancelled = True
             self.status_label.config(text="Cancelling...")
             self.cancel_btn.config(state=tk.DISABLED)
-            self.window.update()
 
     def is_cancelled(self):
         """Check if upload was cancelled."""
@@ -329,14 +1060,24 @@ class UploadProgressWindow:
         return self._current_progress
 
     def update_progress(self, progress):
-        """Update progress bar (0-100)."""
-        import time
-
-        # Initialize start time on first progress update
-        if self.start_time is None and progress > 0:
-            self.start_time = time.time()
-
+        """Record new progress (0-100); it's drawn once Tk is idle (see _drain)."""
         self._current_progress = progress
+        self._pending_progress = progress
+        # Defer the widget work until pending input events are handled; several updates
+        # before then collapse into one redraw
+        if self._drain_after_id is None:
+            self._drain_after_id = self.window.after_idle(self._drain)
+
+    def _drain(self):
+        """Draw the most recent pending progress (if any)."""
+        self._drain_after_id = None
+        if self._pending_progress is not None:
+            progress = self._pending_progress
+            self._pending_progress = None
+            self._render_progress(progress)
+
+    def _render_progress(self, progress):
+        """Update progress bar and labels for the given progress (0-100)."""
         self.progress['value'] = progress
         self.percent_label.config(text=f"{progress:.1f}%")
         self.status_label.config(text=f"Uploading... {progress:.1f}%")
@@ -344,7 +1085,7 @@ class UploadProgressWindow:
         # Calculate transferred bytes
         transferred = int(self.file_size * progress / 100)
         self.transfer_label.config(
-            text=f"{self._format_size(transferred)} / {self._format_size(self.file_size)}"
+            text=f"{self._format_size(transferred)} / {self._total_size_text}"
         )
 
         # Calculate speed and ETA
@@ -366,18 +1107,16 @@ class UploadProgressWindow:
                 else:
                     self.speed_label.config(text=f"Speed: {speed_text} • Complete!")
 
-        self.window.update()
+    # (unit, decimal places) for each power of 1024
+    _SIZE_UNITS = (('B', 0), ('KB', 1), ('MB', 2), ('GB', 2), ('TB', 2))
 
     def _format_size(self, size_bytes):
         """Format bytes into human-readable size."""
         if size_bytes < 1024:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.2f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+        i = min(int(math.log2(size_bytes)) // 10, len(self._SIZE_UNITS) - 1)
+        unit, places = self._SIZE_UNITS[i]
+        return f"{size_bytes / (1 << (10 * i)):.{places}f} {unit}"
 
     def _format_time(self, seconds):
         """Format seconds into human-readable time."""
@@ -393,6 +1132,9 @@ class UploadProgressWindow:
             return f"{hours}h {mins}m"
 
     def close(self):
+        if self._drain_after_id is not None:
+            self.window.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
         self.window.destroy()
 
 
@@ -408,6 +1150,11 @@ class YouTubeUploaderApp:
         self.root.minsize(400, 450)  # Minimum usable size
         self.root.resizable(True, True)
 
+        # Main window (x, y, width, height), kept current from <Configure> so dialogs can be
+        # centered on it without flushing idle tasks first (see _center_dialog)
+        self._root_geom = None
+        self.root.bind('<Configure>', self._on_root_configure, add='+')
+
         # Set window icon
         self.app_icon = create_app_icon(32)
         if self.app_icon:
@@ -415,8 +1162,33 @@ class YouTubeUploaderApp:
 
         self.video_path = video_path
         self.youtube_service = None
-        self.youtube_categories = get_youtube_categories()
+        self.youtube_categories, categories_fresh = get_youtube_categories()
+        self._sorted_categories = tuple(sorted(self.youtube_categories))  # Rebuilt only when the names change
         self._scheduled_videos_cache = None
+        # (account fingerprint, uploads playlist id), so repeat slot lookups skip the cache file
+        self._uploads_playlist = None
+
+        # Shared worker pool for short tasks (thumbnail decoding, token refreshes, sign-in).
+        # Uploads run on their own daemon thread instead: pool workers are joined at
+        # interpreter exit, which would hang on an in-flight upload request. _stopping
+        # tells a running upload to stop between chunks when the app exits.
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ytu')
+        self._stopping = threading.Event()
+        atexit.register(self._shutdown_pool)
+
+        # With a saved token, build the YouTube service in the background so the first API
+        # call doesn't wait on it; _ensure_youtube_service() collects the result
+        self._auth_future = None
+        if TOKEN_FILE.exists() or LEGACY_TOKEN_FILE.exists():
+            self._auth_future = self._pool.submit(get_authenticated_service, False)
+
+        # Thumbnails are decoded off the Tk thread; the token discards stale results
+        self._thumb_token = 0
+
+        # Upload complete dialog, built the first time an upload finishes and then reused
+        self._complete_dialog = None
+        # Scheduled videos dialog, built the first time "View Schedule" is used and then reused
+        self._schedule_dialog = None
 
         self._create_menu()
         self._create_widgets()
@@ -438,7 +1210,28 @@ class YouTubeUploaderApp:
             self._update_thumbnail(video_path)
 
         # Try to refresh categories in background if cache is stale
-        self.root.after(500, self._refresh_categories_if_needed)
+        if not categories_fresh:
+            self._refresh_categories_if_needed()
+
+        # Keep the OAuth token fresh in the background so uploads don't wait on a refresh
+        self._maybe_refresh_token()
+
+    def _on_root_configure(self, event):
+        """Remember the main window's geometry (child widgets' <Configure> events are ignored)."""
+        if event.widget is self.root:
+            self._root_geom = (self.root.winfo_x(), self.root.winfo_y(), event.width, event.height)
+
+    def _center_dialog(self, dialog, width, height):
+        """Move a width x height dialog to the center of the main window."""
+        if self._root_geom is None:
+            # Main window hasn't been configured yet; measure it directly
+            self.root.update_idletasks()
+            self._root_geom = (self.root.winfo_x(), self.root.winfo_y(),
+                               self.root.winfo_width(), self.root.winfo_height())
+        root_x, root_y, root_width, root_height = self._root_geom
+        x = root_x + (root_width - width) // 2
+        y = root_y + (root_height - height) // 2
+        dialog.geometry(f"+{x}+{y}")
 
     def _create_menu(self):
         """Create the menu bar."""
@@ -463,10 +1256,7 @@ class YouTubeUploaderApp:
         dialog.transient(self.root)
 
         # Center on parent
-        dialog.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() - 600) // 2
-        y = self.root.winfo_y() + (self.root.winfo_height() - 500) // 2
-        dialog.geometry(f"+{x}+{y}")
+        self._center_dialog(dialog, 600, 500)
 
         main_frame = ttk.Frame(dialog, padding=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -501,12 +1291,12 @@ class YouTubeUploaderApp:
         history_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         list_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Populate list
-        for entry in history:
-            title = entry.get('title', 'Untitled')[:40]
-            date = entry.get('uploaded_at', '')[:10]
-            video_path = entry.get('video_path', entry.get('filename', 'Unknown'))
-            history_listbox.insert(tk.END, f"{date} - {video_path}")
+        # Populate list in a single Tcl call
+        rows = [
+            f"{entry.get('uploaded_at', '')[:10]} - {entry.get('video_path', entry.get('filename', 'Unknown'))}"
+            for entry in history
+        ]
+        history_listbox.insert(tk.END, *rows)
 
         # Right side: details
         details_frame = ttk.Frame(paned)
@@ -654,10 +1444,26 @@ class YouTubeUploaderApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        # Enable mousewheel scrolling
+        # Enable mousewheel scrolling, only while the pointer is over the canvas (so wheel
+        # events in other windows, e.g. the history dialog, don't go through this handler)
         def on_mousewheel(event):
+            # The description Text and the comboboxes already handled this wheel event through
+            # their class bindings; scrolling the form too would move both at once
+            if isinstance(event.widget, (tk.Text, ttk.Combobox)):
+                return "break"
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+
+        def on_canvas_leave(event):
+            # Moving onto one of the canvas's own child widgets also fires <Leave>
+            try:
+                widget = canvas.winfo_containing(event.x_root, event.y_root)
+            except KeyError:  # Tk-internal widget (e.g. a combobox dropdown)
+                widget = None
+            if widget is None or not str(widget).startswith(str(canvas)):
+                canvas.unbind_all("<MouseWheel>")
+
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
+        canvas.bind("<Leave>", on_canvas_leave)
 
         # Video file selection
         ttk.Label(main_frame, text="Video File:", font=('Segoe UI', 10, 'bold')).pack(anchor=tk.W)
@@ -681,7 +1487,8 @@ class YouTubeUploaderApp:
         self.thumbnail_label = ttk.Label(file_frame, cursor='hand2')
         self.thumbnail_label.bind('<Button-1>', self._show_full_thumbnail)
         self.thumbnail_image = None  # Keep reference to prevent garbage collection
-        self.thumbnail_full_image = None  # Full-size image for popup
+        self.thumbnail_full_pil = None  # Full-size PIL image for popup
+        self.thumbnail_full_image = None  # Its PhotoImage, created the first time the popup opens
         # Will be shown when a video is selected
 
         # Title
@@ -713,7 +1520,7 @@ class YouTubeUploaderApp:
         self.category_combo = ttk.Combobox(
             main_frame,
             textvariable=self.category_var,
-            values=sorted(self.youtube_categories.keys()),
+            values=self._sorted_categories,
             state='readonly'
         )
         self.category_combo.pack(fill=tk.X, pady=(5, 10))
@@ -728,22 +1535,22 @@ class YouTubeUploaderApp:
 
         ttk.Radiobutton(
             privacy_frame, text="Private (only you can see)",
-            variable=self.privacy_var, value="private"
+            variable=self.privacy_var, value="private", command=self._on_privacy_change
         ).pack(anchor=tk.W)
 
         ttk.Radiobutton(
             privacy_frame, text="Unlisted (anyone with link can see)",
-            variable=self.privacy_var, value="unlisted"
+            variable=self.privacy_var, value="unlisted", command=self._on_privacy_change
         ).pack(anchor=tk.W)
 
         ttk.Radiobutton(
             privacy_frame, text="Public (everyone can see)",
-            variable=self.privacy_var, value="public"
+            variable=self.privacy_var, value="public", command=self._on_privacy_change
         ).pack(anchor=tk.W)
 
         ttk.Radiobutton(
             privacy_frame, text="Scheduled (publish at a specific time)",
-            variable=self.privacy_var, value="scheduled"
+            variable=self.privacy_var, value="scheduled", command=self._on_privacy_change
         ).pack(anchor=tk.W)
 
         # Warning label for public
@@ -768,20 +1575,19 @@ class YouTubeUploaderApp:
         date_frame.grid(row=0, column=1, sticky=tk.W)
 
         # Default to tomorrow
-        tomorrow = datetime.now() + timedelta(days=1)
+        now = datetime.now()
+        tomorrow = now + timedelta(days=1)
 
-        self.month_var = tk.StringVar(value=str(tomorrow.month).zfill(2))
-        self.day_var = tk.StringVar(value=str(tomorrow.day).zfill(2))
+        self.month_var = tk.StringVar(value=f"{tomorrow.month:02d}")
+        self.day_var = tk.StringVar(value=f"{tomorrow.day:02d}")
         self.year_var = tk.StringVar(value=str(tomorrow.year))
 
-        months = [str(i).zfill(2) for i in range(1, 13)]
-        days = [str(i).zfill(2) for i in range(1, 32)]
-        years = [str(y) for y in range(datetime.now().year, datetime.now().year + 3)]
+        years = [str(y) for y in range(now.year, now.year + 3)]
 
-        month_combo = ttk.Combobox(date_frame, textvariable=self.month_var, values=months, width=4, state='readonly')
+        month_combo = ttk.Combobox(date_frame, textvariable=self.month_var, values=_MONTHS, width=4, state='readonly')
         month_combo.pack(side=tk.LEFT)
         ttk.Label(date_frame, text="/").pack(side=tk.LEFT)
-        day_combo = ttk.Combobox(date_frame, textvariable=self.day_var, values=days, width=4, state='readonly')
+        day_combo = ttk.Combobox(date_frame, textvariable=self.day_var, values=_DAYS, width=4, state='readonly')
         day_combo.pack(side=tk.LEFT)
         ttk.Label(date_frame, text="/").pack(side=tk.LEFT)
         year_combo = ttk.Combobox(date_frame, textvariable=self.year_var, values=years, width=6, state='readonly')
@@ -797,16 +1603,13 @@ class YouTubeUploaderApp:
         self.minute_var = tk.StringVar(value="00")
         self.ampm_var = tk.StringVar(value="PM")
 
-        hours = [str(i).zfill(2) for i in range(1, 13)]
-        minutes = [str(i).zfill(2) for i in range(0, 60, 5)]
-
-        hour_combo = ttk.Combobox(time_frame, textvariable=self.hour_var, values=hours, width=4, state='readonly')
+        hour_combo = ttk.Combobox(time_frame, textvariable=self.hour_var, values=_HOURS, width=4, state='readonly')
         hour_combo.pack(side=tk.LEFT)
         ttk.Label(time_frame, text=":").pack(side=tk.LEFT)
-        minute_combo = ttk.Combobox(time_frame, textvariable=self.minute_var, values=minutes, width=4, state='readonly')
+        minute_combo = ttk.Combobox(time_frame, textvariable=self.minute_var, values=_MINUTES, width=4, state='readonly')
         minute_combo.pack(side=tk.LEFT)
         ttk.Label(time_frame, text=" ").pack(side=tk.LEFT)
-        ampm_combo = ttk.Combobox(time_frame, textvariable=self.ampm_var, values=["AM", "PM"], width=4, state='readonly')
+        ampm_combo = ttk.Combobox(time_frame, textvariable=self.ampm_var, values=_AMPM, width=4, state='readonly')
         ampm_combo.pack(side=tk.LEFT)
 
         ttk.Label(self.schedule_frame, text="(Local time - will be converted to UTC)", font=('Segoe UI', 8)).pack(anchor=tk.W, pady=(5, 0))
@@ -833,8 +1636,6 @@ class YouTubeUploaderApp:
         self.slot_status_label = ttk.Label(self.schedule_frame, text="", font=('Segoe UI', 8))
         self.slot_status_label.pack(anchor=tk.W, pady=(2, 0))
 
-        self.privacy_var.trace_add('write', self._on_privacy_change)
-
         # Made for kids
         self.kids_var = tk.BooleanVar(value=False)
         self.kids_checkbox = ttk.Checkbutton(
@@ -849,10 +1650,14 @@ class YouTubeUploaderApp:
         btn_frame.pack(fill=tk.X, pady=(10, 5))
 
         ttk.Button(btn_frame, text="Cancel", command=self.root.quit).pack(side=tk.RIGHT)
-        ttk.Button(btn_frame, text="Upload", command=self._upload).pack(side=tk.RIGHT, padx=(0, 10))
+        self.upload_btn = ttk.Button(btn_frame, text="Upload", command=self._upload)
+        self.upload_btn.pack(side=tk.RIGHT, padx=(0, 10))
+
+    def _on_privacy_change(self):
+        """Show/hide warning and schedule frame based on privacy selection.
 
-    def _on_privacy_change(self, *args):
-        """Show/hide warning and schedule frame based on privacy selection."""
+        Called by the privacy radiobuttons; code that sets privacy_var must call it itself.
+        """
         privacy = self.privacy_var.get()
 
         # Handle warning label
@@ -868,44 +1673,71 @@ class YouTubeUploaderApp:
             self.schedule_frame.pack_forget()
 
     def _refresh_categories_if_needed(self):
-        """Refresh categories from API if cache is stale and we have credentials."""
-        # Check if cache needs refresh
-        needs_refresh = True
-        if CATEGORIES_CACHE_FILE.exists():
-            try:
-                with open(CATEGORIES_CACHE_FILE, 'r') as f:
-                    cache_data = json.load(f)
-                fetched_at = datetime.fromisoformat(cache_data["fetched_at"])
-                if datetime.now() - fetched_at < timedelta(days=7):
-                    needs_refresh = False
-            except Exception:
-                pass
-
-        if not needs_refresh:
-            return
+        """Revalidate the categories cache on the worker pool. Only called when it's stale.
 
+        Chains off the background sign-in started in __init__, so nothing on the Tk thread
+        waits for it; the request uses its own API client, so it never shares
+        youtube_service's connection. _apply_refreshed_categories shows the result.
+        """
         # Only try if we have saved credentials (don't prompt user)
-        if not TOKEN_FILE.exists():
+        if self._auth_future is None:
+            return
+        future = self._pool.submit(_refresh_categories_in_background, self._auth_future)
+        self._when_done(future, self._apply_refreshed_categories)
+
+    def _apply_refreshed_categories(self, future):
+        """Update the category combobox from a finished refresh (runs on the Tk thread)."""
+        if future.exception():
+            return  # Silent fail, we have fallback categories
+        new_categories = future.result()
+        if not new_categories or new_categories == self.youtube_categories:
             return
+        names_changed = new_categories.keys() != self.youtube_categories.keys()
+        self.youtube_categories = new_categories
+        if not names_changed:
+            return  # Only ids changed; the combobox shows names
+        self._sorted_categories = tuple(sorted(new_categories))
+        current_value = self.category_var.get()
+        self.category_combo.configure(values=self._sorted_categories)
+        # Keep current selection if valid, otherwise default to Entertainment
+        if current_value not in new_categories:
+            if "Entertainment" in new_categories:
+                self.category_var.set("Entertainment")
+            elif new_categories:
+                self.category_var.set(list(new_categories.keys())[0])
+
+    def _ensure_youtube_service(self, interactive=True):
+        """Return the YouTube service, authenticating first if needed (None on failure).
+
+        Uses the service built in the background at startup, waiting for it if it's still
+        being built, and only falls back to signing in again if that didn't produce one.
+        """
+        if not self.youtube_service and self._auth_future is not None:
+            future, self._auth_future = self._auth_future, None
+            try:
+                self.youtube_service = future.result()
+            except Exception as e:
+                print(f"Background authentication failed: {e}")
+        if not self.youtube_service:
+            self.youtube_service = get_authenticated_service(interactive)
+        return self.youtube_service
 
-        try:
-            if not self.youtube_service:
-                self.youtube_service = get_authenticated_service()
-
-            if self.youtube_service:
-                new_categories = fetch_and_cache_categories(self.youtube_service)
-                if new_categories:
-                    self.youtube_categories = new_categories
-                    current_value = self.category_var.get()
-                    self.category_combo['values'] = sorted(new_categories.keys())
-                    # Keep current selection if valid, otherwise default to Entertainment
-                    if current_value not in new_categories:
-                        if "Entertainment" in new_categories:
-                            self.category_var.set("Entertainment")
-                        elif new_categories:
-                            self.category_var.set(list(new_categories.keys())[0])
-        except Exception:
-            pass  # Silent fail, we have fallback categories
+    def _when_done(self, future, callback, *args):
+        """Call callback(*args, future) on the Tk thread once future has finished.
+
+        Worker threads never call into Tk, not even root.after (which only works from other
+        threads with a thread-enabled Tcl); the Tk thread polls the future instead, and only
+        while it's pending. Upload progress goes through check_upload's queue the same way.
+        """
+        if future.done():
+            callback(*args, future)
+        else:
+            self.root.after(FUTURE_POLL_MS, self._when_done, future, callback, *args)
+
+    def _maybe_refresh_token(self):
+        """Refresh the OAuth token on a worker thread if it's about to expire, then re-arm."""
+        self._pool.submit(refresh_credentials_if_expiring)
+        self.root.after(TOKEN_REFRESH_CHECK_MS, self._maybe_refresh_token)
 
     def _on_drop(self, event):
         """Handle file drop onto the window."""
@@ -951,94 +1783,58 @@ class YouTubeUploaderApp:
         self._update_thumbnail(file_path)
 
     def _update_thumbnail(self, video_path):
-        """Extract and display a thumbnail from the video."""
-        try:
-            # Open the video file
-            cap = cv2.VideoCapture(video_path)
-            if not cap.isOpened():
-                self.thumbnail_label.pack_forget()
-                return
-
-            # Get video properties
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-
-            # Seek to 10% into the video (or 1 second, whichever is less)
-            # This usually gets a more interesting frame than the first frame
-            if total_frames > 0 and fps > 0:
-                target_frame = min(int(total_frames * 0.1), int(fps))  # 10% or 1 second
-                cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-
-            # Read a frame
-            ret, frame = cap.read()
-            cap.release()
-
-            if not ret or frame is None:
-                self.thumbnail_label.pack_forget()
-                return
-
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # Convert to PIL Image
-            pil_image = Image.fromarray(frame_rgb)
-
-            # Store full-size image for popup (scaled to reasonable max size)
-            full_width, full_height = pil_image.size
-            max_full_dim = 800
-            if full_width > max_full_dim or full_height > max_full_dim:
-                if full_width > full_height:
-                    ratio = max_full_dim / full_width
-                else:
-                    ratio = max_full_dim / full_height
-                full_image = pil_image.resize(
-                    (int(full_width * ratio), int(full_height * ratio)),
-                    Image.Resampling.LANCZOS
-                )
-            else:
-                full_image = pil_image.copy()
-            self.thumbnail_full_image = ImageTk.PhotoImage(full_image)
-
-            # Resize to fit next to browse button (small thumbnail)
-            max_height = 40
-            width, height = pil_image.size
-            ratio = max_height / height
-            new_width = int(width * ratio)
-            pil_image = pil_image.resize((new_width, max_height), Image.Resampling.LANCZOS)
-
-            # Convert to PhotoImage for tkinter
-            self.thumbnail_image = ImageTk.PhotoImage(pil_image)
-
-            # Update the label
-            self.thumbnail_label.configure(image=self.thumbnail_image)
-            self.thumbnail_label.pack(side=tk.LEFT, padx=(5, 0))
-
-        except Exception as e:
+        """Extract and display a thumbnail from the video (decoded on a worker thread)."""
+        # Bump the token so results from an older, still-running extraction are ignored
+        self._thumb_token += 1
+        token = self._thumb_token
+        future = self._pool.submit(_extract_thumbnail_images, video_path)
+        self._when_done(future, self._apply_thumbnail, token)
+
+    def _apply_thumbnail(self, token, future):
+        """Show the extracted thumbnail (runs on the Tk thread)."""
+        if token != self._thumb_token:
+            return  # A newer file was selected while this one was being decoded
+
+        images = None
+        if not future.exception():
+            images = future.result()
+        if images is None:
             # If thumbnail extraction fails, just hide the label
             self.thumbnail_label.pack_forget()
+            self.thumbnail_full_pil = None
             self.thumbnail_full_image = None
+            return
+
+        full_image, small_image = images
+        # Only the Tk image objects are created here; Tk isn't thread-safe. The full-size one
+        # waits until the popup is actually opened.
+        self.thumbnail_full_pil = full_image
+        self.thumbnail_full_image = None
+        self.thumbnail_image = ImageTk.PhotoImage(small_image)
+
+        # Update the label
+        self.thumbnail_label.configure(image=self.thumbnail_image)
+        self.thumbnail_label.pack(side=tk.LEFT, padx=(5, 0))
 
     def _show_full_thumbnail(self, event=None):
         """Show the full-size thumbnail in a popup window."""
-        if not self.thumbnail_full_image:
+        if not self.thumbnail_full_pil:
             return
+        if self.thumbnail_full_image is None:
+            self.thumbnail_full_image = ImageTk.PhotoImage(self.thumbnail_full_pil)
 
         popup = tk.Toplevel(self.root)
         popup.title("Video Thumbnail")
         popup.transient(self.root)
 
         # Get image dimensions
-        img_width = self.thumbnail_full_image.width()
-        img_height = self.thumbnail_full_image.height()
+        img_width, img_height = self.thumbnail_full_pil.size
 
         # Set window size to fit image with small padding
         popup.geometry(f"{img_width + 20}x{img_height + 70}")
 
         # Center on parent
-        popup.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() - img_width - 20) // 2
-        y = self.root.winfo_y() + (self.root.winfo_height() - img_height - 50) // 2
-        popup.geometry(f"+{x}+{y}")
+        self._center_dialog(popup, img_width + 20, img_height + 50)
 
         frame = ttk.Frame(popup, padding=10)
         frame.pack(fill=tk.BOTH, expand=True)
@@ -1059,34 +1855,43 @@ class YouTubeUploaderApp:
         self.slot_status_label.config(text="Searching for scheduled videos...")
         self.view_schedule_btn.config(state=tk.DISABLED)
         self._scheduled_videos_cache = None
-        self.root.update()
+        # Only redraw the status label; a full update() would also dispatch clicks mid-call
+        self.root.update_idletasks()
 
         # Authenticate if needed
-        if not self.youtube_service:
-            self.youtube_service = get_authenticated_service()
-            if not self.youtube_service:
-                self.slot_status_label.config(text="Authentication failed")
-                return
+        if not self._ensure_youtube_service():
+            self.slot_status_label.config(text="Authentication failed")
+            return
 
         try:
-            # Get the user's channel
-            channels_response = self.youtube_service.channels().list(
-                mine=True,
-                part='contentDetails'
-            ).execute()
-
-            if not channels_response.get('items'):
-                self.slot_status_label.config(text="No channel found")
-                return
-
-            # Get uploads playlist ID
-            uploads_playlist_id = channels_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+            # Get the uploads playlist ID (cached per account; it never changes)
+            account = _account_fingerprint()
+            if self._uploads_playlist and self._uploads_playlist[0] == account:
+                uploads_playlist_id = self._uploads_playlist[1]
+            else:
+                uploads_playlist_id = load_cached_uploads_playlist_id()
+            if not uploads_playlist_id:
+                channels_response = self.youtube_service.channels().list(
+                    mine=True,
+                    part='contentDetails',
+                    fields='items(id,contentDetails/relatedPlaylists/uploads)'
+                ).execute()
+
+                if not channels_response.get('items'):
+                    self.slot_status_label.config(text="No channel found")
+                    return
+
+                channel = channels_response['items'][0]
+                uploads_playlist_id = channel['contentDetails']['relatedPlaylists']['uploads']
+                save_uploads_playlist_id(channel['id'], uploads_playlist_id)
+            self._uploads_playlist = (account, uploads_playlist_id)
 
             # Get recent videos from uploads playlist (get more to find scheduled ones)
             playlist_response = self.youtube_service.playlistItems().list(
                 playlistId=uploads_playlist_id,
                 part='contentDetails',
-                maxResults=50
+                maxResults=50,
+                fields='items/contentDetails/videoId'
             ).execute()
 
             if not playlist_response.get('items'):
@@ -1099,19 +1904,12 @@ class YouTubeUploaderApp:
             # Get video details including status
             videos_response = self.youtube_service.videos().list(
                 id=','.join(video_ids),
-                part='status,snippet'
+                part='status,snippet',
+                fields='items(id,snippet/title,status/publishAt)'  # Only what's used below
             ).execute()
 
-            # Get timezone offset for local time conversion
-            import time
-            if time.daylight and time.localtime().tm_isdst:
-                utc_offset_seconds = -time.altzone
-            else:
-                utc_offset_seconds = -time.timezone
-
             # Find videos with publishAt (scheduled videos)
             scheduled_videos = []
-            now = datetime.utcnow()
 
             for video in videos_response.get('items', []):
                 status = video.get('status', {})
@@ -1119,21 +1917,21 @@ class YouTubeUploaderApp:
 
                 if publish_at:
                     # Parse ISO 8601 datetime
-                    # Format: 2026-01-20T17:00:00Z or 2026-01-20T17:00:00.000Z
-                    publish_at_clean = publish_at.replace('Z', '+00:00')
-                    if '.' in publish_at_clean:
-                        dt_utc = datetime.fromisoformat(publish_at_clean.split('.')[0])
-                    else:
-                        dt_utc = datetime.fromisoformat(publish_at_clean.replace('+00:00', ''))
+                    # Format: 2026-01-20T17:00:00Z or 2026-01-20T17:00:00.000Z (always UTC), so
+                    # the first 19 characters are the whole timestamp in both forms
+                    dt_utc = datetime.fromisoformat(publish_at[:19]).replace(tzinfo=timezone.utc)
 
-                    # Convert to local time
-                    dt_local = dt_utc + timedelta(seconds=utc_offset_seconds)
+                    # Convert to (naive) local time, using the UTC offset in effect on that date
+                    dt_local = dt_utc.astimezone().replace(tzinfo=None)
 
+                    title = video['snippet']['title']
                     scheduled_videos.append({
-                        'title': video['snippet']['title'],
-                        'publishAt': dt_utc,
+                        'title': title,
+                        'publishTs': int(dt_utc.timestamp()),  # Epoch seconds, the sort key
                         'publishAtLocal': dt_local,
-                        'publishAtStr': publish_at
+                        # Display strings for the schedule dialog, formatted once per fetch
+                        'publishAtLocalStr': dt_local.strftime(SCHEDULE_DISPLAY_FORMAT),
+                        'titleTrunc': title[:50] + ('...' if len(title) > 50 else '')
                     })
 
             if not scheduled_videos:
@@ -1145,9 +1943,9 @@ class YouTubeUploaderApp:
                     self._set_schedule_datetime(next_dt)
                 return
 
-            # Sort by publish date (earliest first for display, but we need latest for calculation)
-            scheduled_videos.sort(key=lambda x: x['publishAt'])
-            latest = scheduled_videos[-1]  # Last one is the latest
+            # Sort once by publish date, earliest first; the schedule dialog shows it in this order
+            scheduled_videos.sort(key=itemgetter('publishTs'))
+            latest = scheduled_videos[-1]
 
             # Calculate next day at same time
             next_day_local = latest['publishAtLocal'] + timedelta(days=1)
@@ -1159,7 +1957,8 @@ class YouTubeUploaderApp:
             self._scheduled_videos_cache = {
                 'videos': scheduled_videos,
                 'latest': latest,
-                'next_day': next_day_local
+                'next_day': next_day_local,
+                'next_day_str': next_day_local.strftime(SCHEDULE_DISPLAY_FORMAT)
             }
             self.view_schedule_btn.config(state=tk.NORMAL)
 
@@ -1180,28 +1979,62 @@ class YouTubeUploaderApp:
         self._show_scheduled_videos_dialog(
             self._scheduled_videos_cache['videos'],
             self._scheduled_videos_cache['latest'],
-            self._scheduled_videos_cache['next_day']
+            self._scheduled_videos_cache['next_day_str']
+        )
+
+    def _show_scheduled_videos_dialog(self, scheduled_videos, latest, next_day_str):
+        """Show a dialog with all scheduled videos.
+
+        The dialog is built on first use and then hidden and reused; only the list is refilled.
+        """
+        if self._schedule_dialog is None:
+            self._build_scheduled_videos_dialog()
+        dialog = self._schedule_dialog
+        text_widget = self._schedule_text
+
+        # _calculate_next_day_slot() already sorted the list by publish date, earliest first
+        self._schedule_count_label.config(text=f"Upcoming Scheduled Videos ({len(scheduled_videos)}):")
+
+        # Build the list in Python and insert it with one Tk call: Text.insert takes
+        # alternating (chars, tags) pairs, so the latest video and the new slot keep their tags
+        lines = [f"{video['publishAtLocalStr']}\n  {video['titleTrunc']}\n\n" for video in scheduled_videos]
+        # latest is one of the list's own dicts, so find it by identity (list.index() would
+        # compare every earlier dict's contents against it first)
+        latest_index = next(i for i, video in enumerate(scheduled_videos) if video is latest)
+        new_line = f"{next_day_str}\n  → YOUR NEW VIDEO (this upload)\n"
+        text_widget.configure(state=tk.NORMAL)
+        text_widget.delete("1.0", tk.END)
+        text_widget.insert(
+            tk.END,
+            "".join(lines[:latest_index]), (),
+            lines[latest_index], 'latest',
+            "".join(lines[latest_index + 1:]), (),
+            new_line, 'new_video'
         )
 
-    def _show_scheduled_videos_dialog(self, scheduled_videos, latest, next_day_local):
-        """Show a dialog with all scheduled videos."""
+        # Make text widget read-only
+        text_widget.configure(state=tk.DISABLED)
+        text_widget.yview_moveto(0)
+
+        # Center on parent
+        self._center_dialog(dialog, 500, 400)
+        dialog.deiconify()
+        dialog.grab_set()
+        dialog.focus_set()
+
+    def _build_scheduled_videos_dialog(self):
+        """Create the (hidden) scheduled videos dialog; _show_scheduled_videos_dialog fills it in."""
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Scheduled Videos")
         dialog.geometry("500x400")
         dialog.transient(self.root)
-        dialog.grab_set()
-
-        # Center on parent
-        dialog.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() - 500) // 2
-        y = self.root.winfo_y() + (self.root.winfo_height() - 400) // 2
-        dialog.geometry(f"+{x}+{y}")
 
         frame = ttk.Frame(dialog, padding=15)
         frame.pack(fill=tk.BOTH, expand=True)
 
-        video_count = len(scheduled_videos)
-        ttk.Label(frame, text=f"Upcoming Scheduled Videos ({video_count}):", font=('Segoe UI', 11, 'bold')).pack(anchor=tk.W)
+        self._schedule_count_label = ttk.Label(frame, font=('Segoe UI', 11, 'bold'))
+        self._schedule_count_label.pack(anchor=tk.W)
         ttk.Label(frame, text="(sorted by release date)", font=('Segoe UI', 8), foreground='gray').pack(anchor=tk.W)
 
         # Create scrollable list
@@ -1220,27 +2053,7 @@ class YouTubeUploaderApp:
         text_widget.tag_configure('latest', background='#d4edda', font=('Consolas', 9, 'bold'))
         text_widget.tag_configure('new_video', background='#cce5ff', font=('Consolas', 9, 'bold'))
         text_widget.tag_configure('date', foreground='#0066cc')
-
-        # Add scheduled videos to the list
-        for i, video in enumerate(scheduled_videos):
-            date_str = video['publishAtLocal'].strftime("%a %b %d, %Y @ %I:%M %p")
-            title = video['title'][:50] + ('...' if len(video['title']) > 50 else '')
-
-            is_latest = video == latest
-            line = f"{date_str}\n  {title}\n\n"
-
-            if is_latest:
-                text_widget.insert(tk.END, line, 'latest')
-            else:
-                text_widget.insert(tk.END, line)
-
-        # Add the new video slot
-        new_date_str = next_day_local.strftime("%a %b %d, %Y @ %I:%M %p")
-        new_line = f"{new_date_str}\n  → YOUR NEW VIDEO (this upload)\n"
-        text_widget.insert(tk.END, new_line, 'new_video')
-
-        # Make text widget read-only
-        text_widget.configure(state=tk.DISABLED)
+        self._schedule_text = text_widget
 
         # Legend
         legend_frame = ttk.Frame(frame)
@@ -1254,38 +2067,37 @@ class YouTubeUploaderApp:
         new_label = tk.Label(legend_frame, text=" Your new video ", bg='#cce5ff', font=('Segoe UI', 8))
         new_label.pack(side=tk.LEFT, padx=(5, 0))
 
+        def do_close():
+            dialog.grab_release()
+            dialog.withdraw()
+
         # Close button
-        ttk.Button(frame, text="OK", command=dialog.destroy).pack(pady=(10, 0))
+        ttk.Button(frame, text="OK", command=do_close).pack(pady=(10, 0))
+
+        # Hide (rather than destroy) on Escape or the window's close button
+        dialog.bind('<Escape>', lambda e: do_close())
+        dialog.protocol("WM_DELETE_WINDOW", do_close)
+
+        self._schedule_dialog = dialog
 
     def _set_schedule_datetime(self, dt):
         """Set the schedule UI fields from a datetime object."""
-        self.month_var.set(str(dt.month).zfill(2))
-        self.day_var.set(str(dt.day).zfill(2))
+        self.month_var.set(f"{dt.month:02d}")
+        self.day_var.set(f"{dt.day:02d}")
         self.year_var.set(str(dt.year))
 
-        # Convert to 12-hour format
-        hour = dt.hour
-        if hour == 0:
-            hour_12 = 12
-            ampm = "AM"
-        elif hour < 12:
-            hour_12 = hour
-            ampm = "AM"
-        elif hour == 12:
-            hour_12 = 12
-            ampm = "PM"
-        else:
-            hour_12 = hour - 12
-            ampm = "PM"
+        # Convert to 12-hour format (0 -> 12 AM, 12 -> 12 PM, 13 -> 1 PM, ...)
+        hour_12 = (dt.hour + 11) % 12 + 1
+        ampm = "PM" if dt.hour >= 12 else "AM"
 
-        self.hour_var.set(str(hour_12).zfill(2))
-        self.minute_var.set(str(dt.minute).zfill(2))
+        self.hour_var.set(f"{hour_12:02d}")
+        self.minute_var.set(f"{dt.minute:02d}")
         self.ampm_var.set(ampm)
 
     def _browse_video(self):
         """Open file dialog to select video."""
         filetypes = [
-            ("Video files", " ".join(f"*{ext}" for ext in VIDEO_EXTENSIONS)),
+            ("Video files", _VIDEO_EXTENSIONS_FILEDIALOG),
             ("All files", "*.*")
         ]
         filepath = filedialog.askopenfilename(filetypes=filetypes)
@@ -1308,21 +2120,29 @@ class YouTubeUploaderApp:
             messagebox.showerror("Error", "Downloads directory not found.")
             return
 
-        # Find all video files in Downloads
-        video_files = []
-        for ext in VIDEO_EXTENSIONS:
-            video_files.extend(downloads_dir.glob(f"*{ext}"))
-            video_files.extend(downloads_dir.glob(f"*{ext.upper()}"))
+        # Find the most recent video file in Downloads (one directory scan, checking each
+        # name's extension, rather than a glob per extension and case)
+        latest_video = None
+        latest_mtime = None
+        with os.scandir(downloads_dir) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() not in VIDEO_EXTENSIONS:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest_video, latest_mtime = Path(entry.path), mtime
 
-        if not video_files:
+        if latest_video is None:
             messagebox.showinfo("No Videos Found",
                                f"No video files found in:\n{downloads_dir}\n\n"
-                               f"Supported formats: {', '.join(VIDEO_EXTENSIONS)}")
+                               f"Supported formats: {_VIDEO_EXTENSIONS_DISPLAY}")
             return
 
-        # Find the most recent file by modification time
-        latest_video = max(video_files, key=lambda f: f.stat().st_mtime)
-
         # Set the file path
         self.video_entry.delete(0, tk.END)
         self.video_entry.insert(0, str(latest_video))
@@ -1344,11 +2164,12 @@ class YouTubeUploaderApp:
             messagebox.showerror("Error", "Please select a video file.")
             return False
 
-        if not Path(video_path).exists():
+        video_file = Path(video_path)
+        if not video_file.exists():
             messagebox.showerror("Error", "Video file does not exist.")
             return False
 
-        if Path(video_path).suffix.lower() not in VIDEO_EXTENSIONS:
+        if video_file.suffix.lower() not in VIDEO_EXTENSIONS:
             messagebox.showwarning("Warning", "File may not be a supported video format.")
 
         if not title:
@@ -1406,19 +2227,12 @@ class YouTubeUploaderApp:
     def _datetime_to_iso8601(self, dt):
         """Convert datetime to ISO 8601 format for YouTube API."""
         # YouTube API expects ISO 8601 format with timezone
-        # We need to convert local time to UTC
-        import time
-
-        # Get local timezone offset in seconds
-        if time.daylight and time.localtime().tm_isdst:
-            utc_offset = time.altzone
-        else:
-            utc_offset = time.timezone
+        # We need to convert local time to UTC (a naive datetime is treated as local time,
+        # with the UTC offset in effect on that date rather than today's)
+        utc_dt = dt.astimezone(timezone.utc)
 
-        # Convert to UTC
-        utc_dt = dt + timedelta(seconds=utc_offset)
-
-        return utc_dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        return (f"{utc_dt.year:04d}-{utc_dt.month:02d}-{utc_dt.day:02d}"
+                f"T{utc_dt.hour:02d}:{utc_dt.minute:02d}:{utc_dt.second:02d}.000Z")
 
     def _find_partial_upload_video_id(self, title, description, publish_at):
         """
@@ -1436,13 +2250,14 @@ class YouTubeUploaderApp:
                 order='date'  # Most recent first
             ).execute()
 
+            candidate_ids = []
             for item in search_response.get('items', []):
                 video_title = item['snippet'].get('title', '')
                 video_desc = item['snippet'].get('description', '')
                 video_id = item['id'].get('videoId')
 
                 # Check if title matches exactly
-                if video_title != title:
+                if not video_id or video_title != title:
                     continue
 
                 # Check if description matches (at least the beginning, as it may be truncated in search results)
@@ -1450,22 +2265,31 @@ class YouTubeUploaderApp:
                     # Description doesn't match
                     continue
 
-                # If we have a publish_at time, verify it matches
-                if publish_at and video_id:
-                    # Get full video details to check publishAt
-                    video_response = self.youtube_service.videos().list(
-                        part='status',
-                        id=video_id
-                    ).execute()
+                candidate_ids.append(video_id)
 
-                    if video_response.get('items'):
-                        video_publish_at = video_response['items'][0].get('status', {}).get('publishAt', '')
-                        # Compare publish times (normalize format)
-                        if publish_at.replace('.000Z', 'Z') != video_publish_at.replace('.000Z', 'Z'):
-                            continue
+            if not candidate_ids:
+                return None
+            if not publish_at:
+                return candidate_ids[0]  # Most recent match
+
+            # Verify publishAt for all candidates with a single videos().list call
+            video_response = self.youtube_service.videos().list(
+                part='status',
+                id=','.join(candidate_ids),
+                fields='items(id,status/publishAt)'
+            ).execute()
+            publish_times = {
+                item['id']: item.get('status', {}).get('publishAt', '')
+                for item in video_response.get('items', [])
+            }
 
-                # Found a match!
-                return video_id
+            # Compare publish times (normalize format), keeping the search's most-recent-first order
+            wanted = publish_at.replace('.000Z', 'Z')
+            for video_id in candidate_ids:
+                # A candidate the API returned no details for can't be ruled out
+                if video_id not in publish_times or publish_times[video_id].replace('.000Z', 'Z') == wanted:
+                    # Found a match!
+                    return video_id
 
         except Exception as e:
             print(f"Error searching for partial upload: {e}")
@@ -1478,10 +2302,8 @@ class YouTubeUploaderApp:
             return
 
         # Authenticate if needed
-        if not self.youtube_service:
-            self.youtube_service = get_authenticated_service()
-            if not self.youtube_service:
-                return
+        if not self._ensure_youtube_service():
+            return
 
         video_path = self.video_entry.get().strip()
         title = self.title_entry.get().strip()
@@ -1517,10 +2339,13 @@ class YouTubeUploaderApp:
         if publish_at:
             body['status']['publishAt'] = publish_at
 
-        # Create media upload
+        # Create media upload. Every file goes up in resumable chunks: each finished chunk reports
+        # progress and is a point where Cancel is checked, and a network failure doesn't
+        # restart the whole upload.
+        from googleapiclient.http import MediaFileUpload
         media = MediaFileUpload(
             video_path,
-            chunksize=4*1024*1024,  # 4MB chunks
+            chunksize=UPLOAD_CHUNK_SIZE,
             resumable=True
         )
 
@@ -1540,14 +2365,10 @@ class YouTubeUploaderApp:
             'progress': 0,
         })
 
-        # Upload state shared between threads
-        upload_state = {
-            'response': None,
-            'error': None,
-            'progress': 0,
-            'done': False,
-            'video_id': None,
-        }
+        # Upload state, only touched on the Tk thread. The worker reports to it through
+        # progress_queue as (event, value) pairs: 'progress', then 'response', 'error' or 'cancelled'.
+        upload_state = UploadState()
+        progress_queue = queue.Queue()
 
         def upload_thread():
             """Background thread for uploading."""
@@ -1560,68 +2381,110 @@ class YouTubeUploaderApp:
 
                 response = None
                 while response is None:
-                    # Check for cancellation
-                    if progress_window.is_cancelled():
-                        upload_state['done'] = True
+                    # Check for cancellation (or the app closing)
+                    if progress_window.is_cancelled() or self._stopping.is_set():
+                        progress_queue.put(('cancelled', None))
                         return
 
                     status, response = request.next_chunk()
                     if status:
-                        upload_state['progress'] = status.progress() * 100
-
-                    # If we got a response, extract video_id immediately
-                    if response:
-                        upload_state['video_id'] = response.get('id')
+                        progress_queue.put(('progress', status.progress() * 100))
 
-                upload_state['response'] = response
-                upload_state['done'] = True
+                progress_queue.put(('response', response))
 
             except Exception as e:
-                upload_state['error'] = e
-                upload_state['done'] = True
+                progress_queue.put(('error', e))
 
-        # Start upload in background thread
-        thread = threading.Thread(target=upload_thread, daemon=True)
-        thread.start()
+        # One upload at a time: the upload thread and the cancel cleanup share youtube_service,
+        # whose httplib2 connection isn't thread-safe. Re-enabled once the upload is settled.
+        self.upload_btn.config(state=tk.DISABLED)
+
+        # Start upload on a daemon thread, so closing the app never waits on an in-flight request
+        threading.Thread(target=upload_thread, name='ytu-upload', daemon=True).start()
+
+        # Poll for updates while keeping UI responsive. The interval starts at 50 ms after any
+        # progress and backs off towards 1 s while nothing changes (e.g. mid-chunk).
+        poll_state = {'last_change': time.monotonic(), 'last_rendered_pct': -1}
+        # Progress-only history writes go to disk at most once a second; the terminal
+        # completed/failed/cancelled writes below use update_history_entry directly
+        update_history_progress = throttle(1.0)(update_history_entry)
 
-        # Poll for updates while keeping UI responsive
         def check_upload():
-            # Update progress display
-            if upload_state['progress'] > 0:
-                progress_window.update_progress(upload_state['progress'])
-                # Update history periodically
-                update_history_entry(history_timestamp, {'progress': upload_state['progress']})
+            # Drain everything the worker has reported since the last tick
+            progress_changed = False
+            try:
+                while True:
+                    event, value = progress_queue.get_nowait()
+                    if event == 'progress':
+                        upload_state.progress = value
+                        progress_changed = True
+                        continue
+                    if event == 'response':
+                        upload_state.response = value
+                        upload_state.video_id = value.get('id')
+                    elif event == 'error':
+                        upload_state.error = value
+                    upload_state.done = True
+            except queue.Empty:
+                pass
+
+            # Update progress display (and history) only when a new chunk moved the whole percentage
+            if progress_changed:
+                poll_state['last_change'] = time.monotonic()
+                pct = int(upload_state.progress)
+                if pct != poll_state['last_rendered_pct']:
+                    poll_state['last_rendered_pct'] = pct
+                    progress_window.update_progress(upload_state.progress)
+                    update_history_progress(history_timestamp, {'progress': upload_state.progress})
 
-            if not upload_state['done']:
+            if not upload_state.done:
                 # Continue polling
-                self.root.after(100, check_upload)
+                idle_seconds = time.monotonic() - poll_state['last_change']
+                delay = min(1000, max(50, int(idle_seconds * 200)))
+                self.root.after(delay, check_upload)
                 return
 
             # Upload finished (success, error, or cancelled)
             progress_window.close()
 
-            # Handle cancellation
+            # Handle cancellation. Finding and deleting the partial video are network calls,
+            # so they run on the pool; the result is reported back on the Tk thread.
             if progress_window.is_cancelled():
-                # Try to delete the video from YouTube if it was created
-                video_id = upload_state.get('video_id')
-
-                # If we don't have a video_id, try to find it by searching recent uploads
-                if not video_id:
-                    video_id = self._find_partial_upload_video_id(title, description, publish_at)
-
-                if video_id:
-                    try:
-                        self.youtube_service.videos().delete(id=video_id).execute()
+                # Snapshot what the worker needs now, so it never reads upload_state
+                cancelled_progress = upload_state.progress
+                known_video_id = upload_state.video_id
+
+                def delete_cancelled_video(video_id):
+                    # Try to delete the video from YouTube if it was created.
+                    # If we don't have a video_id, try to find it by searching recent uploads
+                    if not video_id:
+                        video_id = self._find_partial_upload_video_id(title, description, publish_at)
+
+                    del_error = None
+                    if video_id:
+                        try:
+                            self.youtube_service.videos().delete(id=video_id).execute()
+                        except Exception as e:
+                            del_error = e
+                    return video_id, del_error
+
+                def report_cancelled(future):
+                    self.upload_btn.config(state=tk.NORMAL)
+                    if future.exception():
+                        video_id, del_error = known_video_id, future.exception()
+                    else:
+                        video_id, del_error = future.result()
+                    if video_id and not del_error:
                         update_history_entry(history_timestamp, {
                             'status': 'cancelled',
-                            'progress': upload_state['progress'],
+                            'progress': cancelled_progress,
                             'note': 'Video deleted from YouTube',
                         })
                         messagebox.showinfo("Cancelled", "Upload was cancelled and the video was deleted from YouTube.")
-                    except Exception as del_error:
+                    elif video_id:
                         update_history_entry(history_timestamp, {
                             'status': 'cancelled',
-                            'progress': upload_state['progress'],
+                            'progress': cancelled_progress,
                             'video_id': video_id,
                             'note': f'Failed to delete video: {del_error}',
                         })
@@ -1630,26 +2493,31 @@ class YouTubeUploaderApp:
                             f"Video ID: {video_id}\n\n"
                             f"Error: {str(del_error)}\n\n"
                             f"You may need to delete it manually in YouTube Studio.")
-                else:
-                    update_history_entry(history_timestamp, {
-                        'status': 'cancelled',
-                        'progress': upload_state['progress'],
-                    })
-                    messagebox.showinfo("Cancelled", "Upload was cancelled.\n\n"
-                        "No matching video was found on YouTube to delete.")
+                    else:
+                        update_history_entry(history_timestamp, {
+                            'status': 'cancelled',
+                            'progress': cancelled_progress,
+                        })
+                        messagebox.showinfo("Cancelled", "Upload was cancelled.\n\n"
+                            "No matching video was found on YouTube to delete.")
+
+                self._when_done(self._pool.submit(delete_cancelled_video, known_video_id), report_cancelled)
                 return
 
+            self.upload_btn.config(state=tk.NORMAL)
+
             # Handle error
-            if upload_state['error']:
+            if upload_state.error:
                 update_history_entry(history_timestamp, {
                     'status': 'failed',
-                    'error': str(upload_state['error']),
+                    'progress': upload_state.progress,  # The last throttled-away value, if any
+                    'error': str(upload_state.error),
                 })
-                messagebox.showerror("Upload Error", f"Failed to upload video:\n\n{str(upload_state['error'])}")
+                messagebox.showerror("Upload Error", f"Failed to upload video:\n\n{str(upload_state.error)}")
                 return
 
             # Handle success
-            response = upload_state['response']
+            response = upload_state.response
             video_id = response['id']
             video_url = f"https://www.youtube.com/watch?v={video_id}"
             studio_url = f"https://studio.youtube.com/video/{video_id}/edit"
@@ -1671,8 +2539,8 @@ class YouTubeUploaderApp:
 
             self._show_upload_complete_dialog(title, privacy_info, video_url, studio_url)
 
-        # Start polling
-        self.root.after(100, check_upload)
+        # Start polling as soon as Tk is idle; check_upload picks its own interval after that
+        self.root.after_idle(check_upload)
 
     def _reset_form(self):
         """Reset the form for a new upload."""
@@ -1680,20 +2548,29 @@ class YouTubeUploaderApp:
         self.title_entry.delete(0, tk.END)
         self.desc_text.delete("1.0", tk.END)
         self.tags_entry.delete(0, tk.END)
-        self.category_var.set("Entertainment")
-        self.privacy_var.set("scheduled")
-        self.kids_var.set(False)
-        # Reset schedule to tomorrow
+        # Reset choices and the schedule (to tomorrow, 12:00 PM). Variables that already hold
+        # the default are left alone.
         tomorrow = datetime.now() + timedelta(days=1)
-        self.month_var.set(str(tomorrow.month).zfill(2))
-        self.day_var.set(str(tomorrow.day).zfill(2))
-        self.year_var.set(str(tomorrow.year))
-        self.hour_var.set("12")
-        self.minute_var.set("00")
-        self.ampm_var.set("PM")
-        # Hide thumbnail
+        defaults = (
+            (self.category_var, "Entertainment"),
+            (self.privacy_var, "scheduled"),
+            (self.kids_var, False),
+            (self.month_var, f"{tomorrow.month:02d}"),
+            (self.day_var, f"{tomorrow.day:02d}"),
+            (self.year_var, str(tomorrow.year)),
+            (self.hour_var, "12"),
+            (self.minute_var, "00"),
+            (self.ampm_var, "PM"),
+        )
+        for var, value in defaults:
+            if var.get() != value:
+                var.set(value)
+        self._on_privacy_change()  # Setting privacy_var doesn't run the radiobutton command
+        # Hide thumbnail (and drop any extraction still in flight)
+        self._thumb_token += 1
         self.thumbnail_label.pack_forget()
         self.thumbnail_image = None
+        self.thumbnail_full_pil = None
         self.thumbnail_full_image = None
         # Clear scheduled videos cache
         self._scheduled_videos_cache = None
@@ -1701,23 +2578,36 @@ class YouTubeUploaderApp:
         self.slot_status_label.config(text="")
 
     def _show_upload_complete_dialog(self, title, privacy_info, video_url, studio_url):
-        """Show upload complete dialog with clickable link. Returns True if user wants to upload another."""
-        import webbrowser
+        """Show upload complete dialog with clickable link.
+
+        Doesn't block: "Upload Another" resets the form, and closing the dialog any other way
+        quits the app. The dialog is built on first use and then hidden and reused.
+        """
+        if self._complete_dialog is None:
+            self._build_upload_complete_dialog()
+        dialog = self._complete_dialog
+
+        self._complete_title_label.config(text=f"\nTitle: {title}")
+        self._complete_privacy_label.config(text=privacy_info)
+        self._complete_link_label.config(text=video_url)
+        open_video = functools.partial(webbrowser.open, video_url)
+        self._complete_link_label.bind('<Button-1>', lambda e: open_video())  # Don't pass the event on as 'new'
+        self._complete_studio_btn.config(command=functools.partial(webbrowser.open, studio_url))
+
+        # Center on parent
+        self._center_dialog(dialog, 450, 250)
+        dialog.deiconify()
+        dialog.grab_set()
+        dialog.focus_set()
 
+    def _build_upload_complete_dialog(self):
+        """Create the (hidden) upload complete dialog; _show_upload_complete_dialog fills it in."""
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Upload Complete!")
         dialog.geometry("450x250")
         dialog.resizable(False, False)
         dialog.transient(self.root)
-        dialog.grab_set()
-
-        upload_another = [False]  # Use list to allow modification in nested function
-
-        # Center on parent
-        dialog.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() - 450) // 2
-        y = self.root.winfo_y() + (self.root.winfo_height() - 250) // 2
-        dialog.geometry(f"+{x}+{y}")
 
         frame = ttk.Frame(dialog, padding=20)
         frame.pack(fill=tk.BOTH, expand=True)
@@ -1726,8 +2616,10 @@ class YouTubeUploaderApp:
         ttk.Label(frame, text="✓ Video uploaded successfully!",
                   font=('Segoe UI', 11, 'bold'), foreground='green').pack(anchor=tk.W)
 
-        ttk.Label(frame, text=f"\nTitle: {title}", font=('Segoe UI', 10)).pack(anchor=tk.W)
-        ttk.Label(frame, text=privacy_info, font=('Segoe UI', 10)).pack(anchor=tk.W)
+        self._complete_title_label = ttk.Label(frame, font=('Segoe UI', 10))
+        self._complete_title_label.pack(anchor=tk.W)
+        self._complete_privacy_label = ttk.Label(frame, font=('Segoe UI', 10))
+        self._complete_privacy_label.pack(anchor=tk.W)
 
         # URL section
         url_frame = ttk.Frame(frame)
@@ -1736,42 +2628,46 @@ class YouTubeUploaderApp:
         ttk.Label(url_frame, text="URL: ", font=('Segoe UI', 10)).pack(side=tk.LEFT)
 
         # Clickable link
-        link_label = tk.Label(url_frame, text=video_url, fg='blue', cursor='hand2',
-                              font=('Segoe UI', 10, 'underline'))
-        link_label.pack(side=tk.LEFT)
-        link_label.bind('<Button-1>', lambda e: webbrowser.open(video_url))
+        self._complete_link_label = tk.Label(url_frame, fg='blue', cursor='hand2',
+                                             font=('Segoe UI', 10, 'underline'))
+        self._complete_link_label.pack(side=tk.LEFT)
 
         # Buttons
         btn_frame = ttk.Frame(frame)
         btn_frame.pack(fill=tk.X, pady=(20, 0))
 
-        def open_studio():
-            webbrowser.open(studio_url)
-
         def do_upload_another():
-            upload_another[0] = True
-            dialog.destroy()
+            dialog.grab_release()
+            dialog.withdraw()
+            self._reset_form()
+
+        def do_close():
+            dialog.grab_release()
+            dialog.withdraw()
+            self.root.quit()
 
-        ttk.Button(btn_frame, text="Open in YouTube Studio", command=open_studio).pack(side=tk.LEFT)
+        self._complete_studio_btn = ttk.Button(btn_frame, text="Open in YouTube Studio")
+        self._complete_studio_btn.pack(side=tk.LEFT)
         ttk.Button(btn_frame, text="Upload Another", command=do_upload_another).pack(side=tk.LEFT, padx=(10, 0))
-        ttk.Button(btn_frame, text="Close", command=dialog.destroy).pack(side=tk.RIGHT)
+        ttk.Button(btn_frame, text="Close", command=do_close).pack(side=tk.RIGHT)
 
-        # Close on Escape
-        dialog.bind('<Escape>', lambda e: dialog.destroy())
-        dialog.focus_set()
+        # Close on Escape or the window's close button
+        dialog.bind('<Escape>', lambda e: do_close())
+        dialog.protocol("WM_DELETE_WINDOW", do_close)
 
-        # Wait for dialog to close
-        self.root.wait_window(dialog)
+        self._complete_dialog = dialog
 
-        # If user wants to upload another, reset the form
-        if upload_another[0]:
-            self._reset_form()
-        else:
-            self.root.quit()
+    def _shutdown_pool(self):
+        """Stop running tasks and shut the worker pool down without waiting on it."""
+        self._stopping.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
     def run(self):
         """Start the application."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._shutdown_pool()
 
 
 def main():